@@ -8,6 +8,8 @@ Runs Bronze → Silver → Gold for a single game date.
 IMPORTANT:
   max_active_runs=1 prevents parallel API calls that would trigger rate limits.
   catchup=False means only today's run is scheduled — history is loaded via CLI backfill.
+  API-calling tasks also share the 1-slot "nba_api" pool (created by
+  airflow-init), so the two DAGs never hit stats.nba.com at the same time.
 """
 
 from datetime import datetime, timedelta
@@ -25,14 +27,19 @@ default_args = {
 # Shared env so Airflow workers can find the nba_etl package
 _PYTHONPATH_ENV = {"PYTHONPATH": "/opt/airflow/plugins"}
 
+# Scheduler-level rate limiting for nba_api calls (1 slot)
+_API_POOL = "nba_api"
+
 with DAG(
     dag_id="nba_etl_pipeline",
     description="NBA Bronze → Silver → Gold daily pipeline",
     default_args=default_args,
     start_date=datetime(2023, 10, 24),  # 2023-24 season opener
-    schedule_interval="@daily",
+    schedule="@daily",
     catchup=False,           # History handled via CLI backfill (see README)
     max_active_runs=1,       # CRITICAL: prevent API rate-limit bans
+    max_active_tasks=1,
+    doc_md=__doc__,
     tags=["nba", "etl"],
 ) as dag:
 
@@ -43,6 +50,7 @@ with DAG(
         task_id="bronze_ingest",
         bash_command="python -m nba_etl.bronze.ingestion {{ ds }}",
         env=_PYTHONPATH_ENV,
+        pool=_API_POOL,
     )
 
     extract = BashOperator(
@@ -69,9 +77,10 @@ with DAG(
     description="Weekly refresh of NBA dimension tables",
     default_args=default_args,
     start_date=datetime(2023, 10, 24),
-    schedule_interval="@weekly",
+    schedule="@weekly",
     catchup=False,
     max_active_runs=1,
+    max_active_tasks=1,
     tags=["nba", "etl", "dimensions"],
 ) as dims_dag:
 
@@ -83,4 +92,5 @@ with DAG(
             "python -m nba_etl.gold.loading {{ ds }} --dims"
         ),
         env=_PYTHONPATH_ENV,
+        pool=_API_POOL,
     )
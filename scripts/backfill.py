@@ -5,6 +5,8 @@ Standalone backfill script — bulk-load historical NBA data.
 Bypasses Airflow scheduling overhead by calling pipeline functions directly.
 Idempotent: skips dates that already have a manifest + Silver parquet.
 Rate-limit safe: random delays between dates + exponential backoff on failures.
+Bronze downloads stay serial; Silver + Gold run in worker processes
+(--workers) so they overlap with the next date's downloads.
 
 Usage (from Docker):
     # Full 20-year backfill
@@ -22,12 +24,17 @@ Usage (from Docker):
 
 import os
 import sys
-import json
+import glob
 import time
 import random
 import argparse
 import logging
 from datetime import datetime, timedelta
+from functools import partial
+from concurrent.futures import (
+    ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 
 # Add src/ to path so nba_etl package is importable
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -38,9 +45,11 @@ from nba_etl.bronze.ingestion import (
 )
 from nba_etl.silver.extraction import (
     process_date, process_players, process_teams,
-    print_validation_report, _all_validations,
+    print_validation_report, _all_validations, ValidationResult, _read_json,
+)
+from nba_etl.gold.loading import (
+    engine, load_date, init_schema, load_dim_players, load_dim_teams,
 )
-from nba_etl.gold.loading import load_date, init_schema, load_dim_players, load_dim_teams
 
 logger = logging.getLogger("backfill")
 
@@ -48,7 +57,8 @@ BRONZE = settings.bronze_path
 
 # ── Rate-limit / retry settings ─────────────────────────────────────
 MAX_RETRIES = 5                # retries per date before giving up
-BASE_BACKOFF = 30              # seconds (doubles each retry: 30, 60, 120, 240, 480)
+BASE_BACKOFF = 30              # seconds (window doubles each retry: 30, 60, ... 480)
+CAP_BACKOFF = 600              # ceiling for a single backoff window (seconds)
 INTER_DATE_DELAY = (1.0, 2.5)  # random sleep range between dates (seconds)
 COOLDOWN_AFTER_ERRORS = 120    # seconds to pause after 3+ consecutive failures
 
@@ -62,36 +72,44 @@ def date_range(start: str, end: str):
         current += timedelta(days=1)
 
 
-def is_already_done(game_date: str) -> bool:
-    """Check if a date has already been fully processed."""
-    manifest = f"{BRONZE}/manifests/{game_date}.json"
-    if not os.path.exists(manifest):
+def scan_done_markers() -> tuple[set[str], set[str]]:
+    """List once which dates have a manifest and which have Silver boxscores."""
+    with os.scandir(f"{BRONZE}/manifests") as entries:
+        manifest_dates = {e.name[:-5] for e in entries if e.name.endswith(".json")}
+    silver_dates = {
+        os.path.basename(os.path.dirname(path)).removeprefix("game_date=")
+        for path in glob.glob(
+            f"{settings.silver_path}/boxscores/season=*/game_date=*/data.parquet"
+        )
+    }
+    return manifest_dates, silver_dates
+
+
+def is_already_done(game_date: str, manifest_dates: set[str],
+                    silver_dates: set[str]) -> bool:
+    """Check if a date has already been fully processed (see scan_done_markers)."""
+    if game_date not in manifest_dates:
         return False
-    with open(manifest) as f:
-        data = json.load(f)
-    if not data.get("game_ids"):
-        return True  # No-game day
-    from nba_etl.silver.extraction import get_nba_season
-    season = get_nba_season(game_date)
-    silver_path = f"{settings.silver_path}/boxscores/season={season}/game_date={game_date}/data.parquet"
-    return os.path.exists(silver_path)
-
-
-def process_single_date(game_date: str):
-    """Bronze → Silver → Gold for one date. Raises on failure."""
-    ingest_date(game_date)
-    process_date(game_date)
+    if game_date in silver_dates:
+        return True
+    data = _read_json(f"{BRONZE}/manifests/{game_date}.json")
+    return not data.get("game_ids")  # No-game day
+
+
+def transform_and_load(game_date: str, force: bool = False):
+    """Silver → Gold for one date (CPU/DB only, no API calls). Raises on failure."""
+    process_date(game_date, force=force)
     load_date(game_date)
 
 
-def process_with_retry(game_date: str) -> bool:
-    """Try a date up to MAX_RETRIES times with exponential backoff.
+def process_with_retry(game_date: str, step) -> bool:
+    """Run step(game_date) up to MAX_RETRIES times with exponential backoff.
 
     Returns True on success, False if all retries exhausted.
     """
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            process_single_date(game_date)
+            step(game_date)
             return True
         except KeyboardInterrupt:
             raise
@@ -100,7 +118,9 @@ def process_with_retry(game_date: str) -> bool:
                 logger.error("GIVING UP on %s after %d attempts: %s",
                              game_date, MAX_RETRIES, e)
                 return False
-            wait = BASE_BACKOFF * (2 ** (attempt - 1)) + random.uniform(0, 5)
+            # Full jitter: spread retries over the whole window so workers desync
+            window = min(CAP_BACKOFF, BASE_BACKOFF * (2 ** (attempt - 1)))
+            wait = random.uniform(0, window)
             logger.warning(
                 "Attempt %d/%d failed for %s: %s — retrying in %.0fs",
                 attempt, MAX_RETRIES, game_date, e, wait,
@@ -109,6 +129,24 @@ def process_with_retry(game_date: str) -> bool:
     return False
 
 
+# ── Worker processes (Silver + Gold) ────────────────────────────────
+
+def _init_worker():
+    # Forked workers must not share the parent's pooled DB connections
+    engine.dispose(close=False)
+    # ...nor report the parent's results (e.g. --dims players/teams) again
+    _all_validations.clear()
+
+
+def _transform_and_load_worker(game_date: str,
+                               force: bool = False) -> tuple[bool, list[ValidationResult]]:
+    """Process-pool entry point: returns success plus this date's validations."""
+    ok = process_with_retry(game_date, partial(transform_and_load, force=force))
+    results = list(_all_validations)
+    _all_validations.clear()
+    return ok, results
+
+
 def load_dimensions():
     """Download and load all dimension tables (teams + players)."""
     logger.info("=" * 60)
@@ -131,8 +169,13 @@ def load_dimensions():
 
 
 def run_backfill(start: str, end: str, skip_existing: bool = True,
-                 load_dims: bool = False):
-    """Run Bronze → Silver → Gold for every date in the range."""
+                 load_dims: bool = False, workers: int = 4):
+    """Run Bronze → Silver → Gold for every date in the range.
+
+    Bronze runs serially in this process (it owns the API rate limit);
+    Silver + Gold for each ingested date run in a pool of worker processes,
+    overlapping with the next date's downloads.
+    """
     dates = list(date_range(start, end))
     total = len(dates)
     skipped = 0
@@ -140,9 +183,10 @@ def run_backfill(start: str, end: str, skip_existing: bool = True,
     failed = 0
     failed_dates = []
     consecutive_errors = 0
+    pending = {}  # future → game_date
 
     logger.info("=" * 60)
-    logger.info("BACKFILL: %s → %s (%d days)", start, end, total)
+    logger.info("BACKFILL: %s → %s (%d days, %d workers)", start, end, total, workers)
     logger.info("=" * 60)
 
     # Ensure Gold schema exists
@@ -152,49 +196,84 @@ def run_backfill(start: str, end: str, skip_existing: bool = True,
     if load_dims:
         load_dimensions()
 
-    for i, game_date in enumerate(dates, 1):
-        # Skip already-processed dates
-        if skip_existing and is_already_done(game_date):
-            skipped += 1
-            if skipped % 100 == 0:
-                logger.info("[%d/%d] Skipped %d already-processed dates...",
-                            i, total, skipped)
-            continue
-
-        logger.info("─" * 60)
-        logger.info("[%d/%d] Processing %s", i, total, game_date)
-        logger.info("─" * 60)
-
-        success = process_with_retry(game_date)
-
-        if success:
+    def collect(future):
+        nonlocal processed, failed
+        game_date = pending.pop(future)
+        try:
+            ok, validations = future.result()
+        except Exception as e:
+            # Worker died (OOM, BrokenProcessPool) or its error didn't pickle
+            logger.error("Worker failed on %s: %s", game_date, e)
+            ok, validations = False, []
+        _all_validations.extend(validations)
+        if ok:
             processed += 1
-            consecutive_errors = 0
+            # Progress update every 50 processed dates
+            if processed % 50 == 0:
+                logger.info(
+                    "PROGRESS: %d processed, %d skipped, %d failed out of %d total",
+                    processed, skipped, failed, total,
+                )
         else:
             failed += 1
             failed_dates.append(game_date)
-            consecutive_errors += 1
-
-            # If we get 3+ consecutive failures, the API is likely blocking us.
-            # Take a long cooldown break before continuing.
-            if consecutive_errors >= 3:
-                logger.warning(
-                    "⚠ %d consecutive failures — API may be rate-limiting. "
-                    "Cooling down for %ds...",
-                    consecutive_errors, COOLDOWN_AFTER_ERRORS,
-                )
-                time.sleep(COOLDOWN_AFTER_ERRORS)
-
-        # Random delay between dates to stay under rate limits
-        delay = random.uniform(*INTER_DATE_DELAY)
-        time.sleep(delay)
 
-        # Progress update every 50 processed dates
-        if processed > 0 and processed % 50 == 0:
-            logger.info(
-                "PROGRESS: %d processed, %d skipped, %d failed out of %d total",
-                processed, skipped, failed, i,
-            )
+    # Two directory scans up front instead of stat calls per date
+    manifest_dates, silver_dates = scan_done_markers() if skip_existing else (set(), set())
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for i, game_date in enumerate(dates, 1):
+            # Skip already-processed dates
+            if skip_existing and is_already_done(game_date, manifest_dates, silver_dates):
+                skipped += 1
+                if skipped % 100 == 0:
+                    logger.info("[%d/%d] Skipped %d already-processed dates...",
+                                i, total, skipped)
+                continue
+
+            logger.info("── [%d/%d] Processing %s", i, total, game_date)
+
+            if process_with_retry(game_date,
+                                  partial(ingest_date, force=not skip_existing)):
+                consecutive_errors = 0
+                try:
+                    pending[pool.submit(_transform_and_load_worker, game_date,
+                                        not skip_existing)] = game_date
+                except BrokenProcessPool as e:
+                    # A worker crashed and took the pool down — stop here
+                    # but still reap what finished and print the summary
+                    logger.error("Worker pool broken at %s: %s", game_date, e)
+                    failed += 1
+                    failed_dates.append(game_date)
+                    break
+            else:
+                failed += 1
+                failed_dates.append(game_date)
+                consecutive_errors += 1
+
+                # If we get 3+ consecutive failures, the API is likely blocking us.
+                # Take a long cooldown break before continuing.
+                if consecutive_errors >= 3:
+                    logger.warning(
+                        "⚠ %d consecutive failures — API may be rate-limiting. "
+                        "Cooling down for %ds...",
+                        consecutive_errors, COOLDOWN_AFTER_ERRORS,
+                    )
+                    time.sleep(COOLDOWN_AFTER_ERRORS)
+
+            # Random delay between dates to stay under rate limits
+            delay = random.uniform(*INTER_DATE_DELAY)
+            time.sleep(delay)
+
+            # Reap finished dates; block only if the backlog outgrows the pool
+            backlog_full = len(pending) >= 2 * workers
+            done, _ = wait(pending, timeout=None if backlog_full else 0,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future)
+
+        for future in as_completed(list(pending)):
+            collect(future)
 
     # Final summary
     logger.info("=" * 60)
@@ -213,6 +292,9 @@ def run_backfill(start: str, end: str, skip_existing: bool = True,
     print_validation_report()
     _all_validations.clear()
 
+    # Pipeline teardown — close pooled DB connections
+    engine.dispose()
+
 
 if __name__ == "__main__":
     logging.basicConfig(
@@ -234,8 +316,13 @@ if __name__ == "__main__":
         "--dims", action="store_true",
         help="Load dimension tables (teams + players) before starting backfill.",
     )
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="Worker processes for Silver + Gold (default: 4).",
+    )
     args = parser.parse_args()
 
     run_backfill(args.start, args.end,
                  skip_existing=not args.force,
-                 load_dims=args.dims)
+                 load_dims=args.dims,
+                 workers=args.workers)
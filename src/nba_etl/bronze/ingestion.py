@@ -10,22 +10,26 @@ parallel backfills across an entire season.
 """
 
 import os
-import json
 import time
 import random
 import logging
 import argparse
 import threading
+from datetime import datetime
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
 from nba_api.stats.static import teams, players
 from nba_api.stats.endpoints import (
     scoreboardv2,
     shotchartdetail,
     boxscoreadvancedv3,
     playbyplayv3,
+    leaguegamefinder,
 )
 from nba_etl.config import settings
+from nba_etl.silver.extraction import _read_json
 
 logger = logging.getLogger(__name__)
 
@@ -37,39 +41,95 @@ for folder in ["teams", "players", "pbp", "boxscores", "shot_chart", "manifests"
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
+# Directory → names of the files already in it, scanned once per process
+_existing: dict[str, set[str]] = {}
+_existing_lock = threading.Lock()
+
+
+def _existing_names(folder: str) -> set[str]:
+    """Names of the files in a Bronze folder (one os.scandir, then cached)."""
+    with _existing_lock:
+        names = _existing.get(folder)
+        if names is None:
+            with os.scandir(folder) as entries:
+                names = {e.name for e in entries}
+            _existing[folder] = names
+        return names
+
+
 def _save_json(data: dict, path: str):
-    with open(path, "w") as f:
-        json.dump(data, f)
+    # orjson encodes straight to UTF-8 bytes — no str → bytes round trip
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data))
+    folder, name = os.path.split(path)
+    with _existing_lock:
+        if folder in _existing:
+            _existing[folder].add(name)
 
 
 def _already_exists(path: str) -> bool:
-    return os.path.exists(path)
+    folder, name = os.path.split(path)
+    return name in _existing_names(folder)
+
+
+def _written_this_week(path: str) -> bool:
+    """True if the file was last written during the current ISO week."""
+    try:
+        mtime = datetime.fromtimestamp(os.path.getmtime(path))
+    except OSError:
+        return False
+    return mtime.isocalendar()[:2] == datetime.now().isocalendar()[:2]
 
 
 # ── Rate-limit aware API caller ──────────────────────────────────────
 
 _MAX_RETRIES = 5
 _BASE_BACKOFF = 10  # seconds — doubles each retry: 10, 20, 40, 80, 160
-_CALL_DELAY = 1.5   # seconds between successful calls
-_JITTER = 1.0       # random 0-1s added to each delay
 _MAX_CONCURRENT = 3  # max simultaneous API requests (threads)
 
 _api_semaphore = threading.Semaphore(_MAX_CONCURRENT)
 
+
+class _TokenBucket:
+    """Thread-safe token bucket: `rate` calls/s on average, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared across threads — paces request *starts* to one per settings.rate_limit
+_api_bucket = _TokenBucket(rate=1 / settings.rate_limit, capacity=_MAX_CONCURRENT)
+
+
 def _api_call(fn, label: str, *args, **kwargs):
     """
     Call an NBA API function with retry + exponential backoff.
-    Uses a global semaphore to limit concurrent requests.
+    A global token bucket paces calls and a semaphore limits concurrency.
     Detects rate-limiting (timeouts, connection resets) and waits.
     Returns the result or raises after MAX_RETRIES.
     """
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
+            _api_bucket.acquire()
             with _api_semaphore:
-                result = fn(*args, **kwargs)
-            # Success — sleep to stay under rate limits
-            time.sleep(_CALL_DELAY + random.uniform(0, _JITTER))
-            return result
+                return fn(*args, **kwargs)
         except KeyboardInterrupt:
             raise
         except Exception as e:
@@ -141,7 +201,7 @@ def download_boxscore(game_id: str):
         game_id=game_id,
     )
     _save_json(result.get_dict(), path)
-    logger.info("boxscore %s ✔", game_id)
+    logger.debug("boxscore %s ✔", game_id)
 
 
 def download_pbp(game_id: str):
@@ -154,7 +214,7 @@ def download_pbp(game_id: str):
         game_id=game_id,
     )
     _save_json(result.get_dict(), path)
-    logger.info("pbp     %s ✔", game_id)
+    logger.debug("pbp     %s ✔", game_id)
 
 
 def download_shotchart(game_id: str):
@@ -170,33 +230,48 @@ def download_shotchart(game_id: str):
         context_measure_simple="FGA",
     )
     _save_json(result.get_dict(), path)
-    logger.info("shots   %s ✔", game_id)
+    logger.debug("shots   %s ✔", game_id)
 
 
 # ── Dimension downloaders (run once / infrequently) ──────────────────
 
-def download_all_teams():
-    from nba_api.stats.endpoints import leaguegamefinder
+def _download_team(team: dict):
+    path = f"{BRONZE}/teams/{team['id']}.json"
+    if _already_exists(path):
+        return
+    result = _api_call(
+        leaguegamefinder.LeagueGameFinder,
+        f"teams/{team['id']}",
+        team_id_nullable=team["id"],
+    )
+    _save_json(result.get_dict(), path)
+    logger.debug("%s ✔", team["full_name"])
 
+
+@lru_cache(maxsize=1)
+def _all_teams() -> list[dict]:
+    """nba_api's static team list — built once per process."""
+    return teams.get_teams()
+
+
+def download_all_teams():
+    """Download every team's game history (threaded, rate-limited by _api_call)."""
     logger.info("Downloading team histories...")
-    for team in teams.get_teams():
-        team_id = team["id"]
-        path = f"{BRONZE}/teams/{team_id}.json"
-        if _already_exists(path):
-            continue
-        try:
-            data = leaguegamefinder.LeagueGameFinder(
-                team_id_nullable=team_id
-            ).get_dict()
-            _save_json(data, path)
-            logger.info("%s ✔", team["full_name"])
-            time.sleep(settings.rate_limit)
-        except Exception as e:
-            logger.error("%s ✘: %s", team["full_name"], e)
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT) as pool:
+        futures = {pool.submit(_download_team, t): t for t in _all_teams()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("%s ✘: %s", futures[future]["full_name"], e)
 
 
 def download_all_players():
     path = f"{BRONZE}/players/players.json"
+    # Rosters change at most weekly — keep this week's snapshot
+    if _written_this_week(path):
+        logger.info("players up to date (this week)")
+        return
     try:
         _save_json(players.get_players(), path)
         logger.info("players ✔")
@@ -213,14 +288,28 @@ def _download_game(game_id: str):
     download_shotchart(game_id)
 
 
-def ingest_date(game_date: str):
-    """Full ingestion for one date, with threaded per-game downloads."""
-    game_ids = get_game_ids_for_date(game_date)
+def ingest_date(game_date: str, force: bool = False):
+    """
+    Full ingestion for one date, with threaded per-game downloads.
+    force=True re-queries the scoreboard even if a manifest exists.
+    """
+    manifest_path = f"{BRONZE}/manifests/{game_date}.json"
+    game_ids = []
+    if not force and _already_exists(manifest_path):
+        # A manifest is only written after a complete ingest — reuse its
+        # game list instead of asking the scoreboard again. An empty one
+        # may predate the schedule being published, so that is re-checked.
+        game_ids = _read_json(manifest_path)["game_ids"]
+        if game_ids:
+            logger.info("Manifest found for %s (%d games) — skipping scoreboard",
+                        game_date, len(game_ids))
+    if not game_ids:
+        game_ids = get_game_ids_for_date(game_date)
 
     if not game_ids:
         logger.info("No games on %s — writing empty manifest.", game_date)
         manifest = {"game_date": game_date, "game_ids": []}
-        _save_json(manifest, f"{BRONZE}/manifests/{game_date}.json")
+        _save_json(manifest, manifest_path)
         return
 
     logger.info("Downloading data for %d games (threaded)...", len(game_ids))
@@ -245,7 +334,7 @@ def ingest_date(game_date: str):
 
     # Save manifest for downstream scripts
     manifest = {"game_date": game_date, "game_ids": game_ids}
-    _save_json(manifest, f"{BRONZE}/manifests/{game_date}.json")
+    _save_json(manifest, manifest_path)
 
     logger.info("Done ingesting %s (%d games)", game_date, len(game_ids))
 
@@ -271,6 +360,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Also download dimension tables (teams + players).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-query the scoreboard even if the date already has a manifest.",
+    )
     args = parser.parse_args()
 
     logger.info("=" * 50)
@@ -281,4 +375,4 @@ if __name__ == "__main__":
         download_all_teams()
         download_all_players()
 
-    ingest_date(args.game_date)
+    ingest_date(args.game_date, force=args.force)
@@ -9,11 +9,16 @@ Defaults point to Airflow paths (/opt/airflow/datalake/...).
 The standalone `etl` container overrides via env vars to /app/datalake/...
 """
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    """Pipeline configuration, overridable via environment variables."""
+    """Pipeline configuration, overridable via environment variables.
+
+    Read once at import and frozen — derived values are computed once.
+    """
 
     # ── Paths ──
     bronze_path: str = "/opt/airflow/datalake/bronze"
@@ -28,17 +33,21 @@ class Settings(BaseSettings):
     db_name: str = "mydatabase"
     db_host: str = "pgdatabase"
     db_port: str = "5432"
+    db_pool_size: int = 8         # persistent connections kept by the engine
+    db_max_overflow: int = 4      # extra connections allowed under burst
+    db_pool_recycle: int = 1800   # seconds before a pooled connection is renewed
 
-    @property
+    @cached_property
     def db_url(self) -> str:
         return (
-            f"postgresql://{self.db_user}:{self.db_pass}"
+            f"postgresql+psycopg2://{self.db_user}:{self.db_pass}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
     class Config:
         env_file = ".env"
         extra = "ignore"
+        frozen = True  # env is read once at import; db_url is cached safely
 
 
 settings = Settings()
@@ -12,64 +12,251 @@ FK enforcement is handled by the database — rows that violate foreign
 key constraints are caught and logged, not silently filtered in Python.
 """
 
+import io
 import os
-import json
+import re
 import logging
 import argparse
-from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine, text
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine, event, text
 
 from nba_etl.config import settings
+from nba_etl.silver.extraction import get_nba_season, _read_json
 
 logger = logging.getLogger(__name__)
 
-engine = create_engine(settings.db_url)
+engine = create_engine(
+    settings.db_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+)
 SILVER = settings.silver_path
 
 
+@contextmanager
+def connection(async_commit: bool = False):
+    """
+    One pooled connection and transaction for a batch of Gold writes.
+
+    async_commit=True skips waiting for the WAL flush at commit, so a crash
+    can lose the last commits. Only for the full-history dimension and
+    team-stat loads, which rewrite everything from Silver on every refresh —
+    never for per-date loads, which backfill and Airflow do not revisit.
+    """
+    with engine.begin() as conn:
+        if async_commit:
+            conn.execute(text("SET LOCAL synchronous_commit = off"))
+        yield conn
+
+
 # ── Schema initializer ───────────────────────────────────────────────
 
 _CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-def init_schema():
-    """Load schema from schema.sql and execute. Safe to call on every run."""
-    sql_path = os.path.join(_CURRENT_DIR, "schema.sql")
-    with open(sql_path, "r") as f:
-        schema_sql = f.read()
-    with engine.begin() as conn:
-        conn.execute(text(schema_sql))
-    logger.info("Schema verified from schema.sql")
+_SCHEMA_PATH = os.path.join(_CURRENT_DIR, "schema.sql")
 
 
-# ── Season helper ────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
+def _load_schema_sql() -> str:
+    with open(_SCHEMA_PATH, "r") as f:
+        return f.read()
 
-def get_nba_season(game_date: str) -> int:
-    dt = datetime.strptime(game_date, "%Y-%m-%d")
-    return dt.year if dt.month >= 10 else dt.year - 1
+
+def init_schema():
+    """Load schema from schema.sql and execute. Safe to call on every run."""
+    schema_sql = _load_schema_sql()
+    # Whole script in one transaction / round trip; exec_driver_sql skips
+    # SQLAlchemy's bind-parameter parsing of the DDL text
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(schema_sql)
+    except Exception:
+        logger.error("Schema initialization failed executing %s", _SCHEMA_PATH)
+        raise
+    logger.info("Schema verified from schema.sql")
 
 
 # ── Partitioned Silver reader ────────────────────────────────────────
 
-def read_silver_partition(dataset: str, game_date: str) -> pd.DataFrame:
+def read_silver_partition(dataset: str, game_date: str,
+                          columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Read one Silver partition; columns= projects at the Parquet reader.
+    Columns stay Arrow-backed (pd.ArrowDtype), so strings are not boxed into
+    Python objects and the COPY path converts back to Arrow without copying.
+    """
     season = get_nba_season(game_date)
     path = f"{SILVER}/{dataset}/season={season}/game_date={game_date}/data.parquet"
     if not os.path.exists(path):
         logger.debug("No Silver data at %s", path)
         return pd.DataFrame()
-    return pd.read_parquet(path)
+    return pq.read_table(path, columns=columns).to_pandas(types_mapper=pd.ArrowDtype)
 
 
 # ── Upsert helper ────────────────────────────────────────────────────
 
-def upsert(df: pd.DataFrame, table_name: str, primary_keys: list[str]) -> int:
+# pandas inferred dtype → staging column type (mirrors what to_sql would pick,
+# so the INSERT ... SELECT into the typed target keeps the same implicit casts)
+_STAGING_TYPES = {
+    "boolean": "BOOLEAN",
+    "integer": "BIGINT",
+    "floating": "DOUBLE PRECISION",
+    "datetime64": "TIMESTAMP",
+    "datetime": "TIMESTAMP",
+    "date": "DATE",
+}
+
+
+# conn.info key: staging table name → column defs created on that session
+_STAGING_INFO_KEY = "nba_etl_staging"
+
+
+@event.listens_for(engine, "rollback")
+def _forget_staging(conn):
+    # Tables created in a rolled-back transaction are gone; recreate next time
+    conn.info.pop(_STAGING_INFO_KEY, None)
+
+
+def _create_staging(conn, df: pd.DataFrame, staging: str):
     """
-    Idempotent load via a staging table.
+    Ensure an empty staging table whose columns match the DataFrame.
+    Staging tables are session TEMP tables (never WAL-logged) emptied on
+    commit, so a pooled connection creates each one once instead of
+    churning the catalog with CREATE/DROP on every upsert.
+    """
+    col_defs = ", ".join(
+        f"{c} {_STAGING_TYPES.get(pd.api.types.infer_dtype(df[c], skipna=True), 'TEXT')}"
+        for c in df.columns
+    )
+    known = conn.info.setdefault(_STAGING_INFO_KEY, {})
+    if known.get(staging) != col_defs:
+        conn.execute(text(f"DROP TABLE IF EXISTS pg_temp.{staging}"))
+        conn.execute(text(
+            f"CREATE TEMP TABLE {staging} ({col_defs}) ON COMMIT DELETE ROWS"
+        ))
+        known[staging] = col_defs
+
+
+# Rows rendered to CSV per chunk while streaming a frame into COPY
+_COPY_CHUNK_ROWS = 10_000
+
+
+class _FrameCsvReader(io.RawIOBase):
+    """
+    Read-only file over a DataFrame rendered as CSV one chunk at a time, so
+    COPY starts streaming immediately and only one chunk of text is alive.
+    The frame is converted to Arrow once; each chunk is a zero-copy slice
+    serialized by pyarrow's CSV writer instead of per-cell Python objects.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = _COPY_CHUNK_ROWS):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        self._chunks = (
+            _render_csv(table.slice(i, chunk_rows))
+            for i in range(0, table.num_rows, chunk_rows)
+        )
+        self._current = io.BytesIO()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        out = self._current.read(size)
+        while size < 0 or len(out) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._current = io.BytesIO(chunk)
+            out += self._current.read(size - len(out) if size >= 0 else -1)
+        return out
+
+
+_CSV_WRITE_OPTS = pa_csv.WriteOptions(include_header=False)
+
+
+def _render_csv(table: pa.Table) -> bytes:
+    # Nulls are written as bare empty fields and strings are always quoted,
+    # which is exactly how COPY's default CSV NULL ('') tells them apart
+    sink = io.BytesIO()
+    pa_csv.write_csv(table, sink, _CSV_WRITE_OPTS)
+    return sink.getvalue()
+
+
+def _copy_frame(conn, df: pd.DataFrame, table: str,
+                chunk_rows: int = _COPY_CHUNK_ROWS):
+    """Bulk-load a DataFrame into an existing table with COPY FROM STDIN."""
+    cols = ", ".join(df.columns)
+    # Raw psycopg2 cursor on the same connection → same transaction
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {table} ({cols}) FROM STDIN WITH (FORMAT CSV)",
+            _FrameCsvReader(df, chunk_rows),
+        )
+
+
+def _drop_secondary_indexes(conn, table_name: str) -> list[str]:
+    """Drop indexes not backing a constraint (PK/unique); return their DDL."""
+    rows = conn.execute(text("""
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = current_schema()
+          AND i.tablename = :table
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c WHERE c.conname = i.indexname
+          )
+    """), {"table": table_name}).fetchall()
+    for index_name, _ in rows:
+        conn.execute(text(f"DROP INDEX {index_name}"))
+    return [index_def for _, index_def in rows]
+
+
+def _recreate_indexes(conn, table_name: str, index_defs: list[str]):
+    for index_def in index_defs:
+        conn.exec_driver_sql(index_def)
+    conn.execute(text(f"ANALYZE {table_name}"))
+
+
+@contextmanager
+def _secondary_indexes_dropped(conn, table_name: str):
+    """
+    Drop table_name's secondary indexes for the duration of a bulk merge and
+    rebuild them (plus ANALYZE) once at the end, instead of maintaining them
+    row by row. Rebuild cost scales with the whole table, so only loaders
+    that own a full-history load should use this — never per-date loads,
+    whose parallel transactions would queue behind the DROP INDEX lock.
+    """
+    index_defs = _drop_secondary_indexes(conn, table_name)
+    yield
+    _recreate_indexes(conn, table_name, index_defs)
+    if index_defs:
+        logger.info("%s: rebuilt %d secondary index(es) after bulk merge",
+                    table_name, len(index_defs))
+
+
+def upsert(df: pd.DataFrame, table_name: str, primary_keys: list[str],
+           update: bool = True, conn=None,
+           batch_size: int = _COPY_CHUNK_ROWS) -> int:
+    """
+    Idempotent load via a staging table, bulk-filled with COPY.
     FK violations are caught by the database and logged — not silently
     skipped in Python.
+
+    With update=False existing rows are left untouched (ON CONFLICT DO
+    NOTHING), e.g. for stub dimension records.
+
+    Pass conn to run inside the caller's transaction; otherwise the upsert
+    commits on its own. batch_size is the rows rendered to CSV per chunk
+    of the single COPY stream.
     """
     if df.empty:
         logger.warning("Empty DataFrame, nothing to load into %s", table_name)
@@ -77,54 +264,67 @@ def upsert(df: pd.DataFrame, table_name: str, primary_keys: list[str]) -> int:
 
     staging = f"_staging_{table_name}"
 
-    with engine.begin() as conn:
-        conn.execute(text(f"DROP TABLE IF EXISTS {staging}"))
-        df.to_sql(staging, conn, if_exists="replace", index=False, method="multi")
+    with nullcontext(conn) if conn is not None else engine.begin() as conn:
+        _create_staging(conn, df, staging)
+        _copy_frame(conn, df, staging, batch_size)
 
         all_cols = list(df.columns)
         pk_clause = ", ".join(primary_keys)
         non_pk_cols = [c for c in all_cols if c not in primary_keys]
 
         insert_cols = ", ".join(all_cols)
-        select_cols = ", ".join(f"s.{c}" for c in all_cols)
+        exprs = _SELECT_EXPRS.get(table_name, {})
+        select_cols = ", ".join(exprs.get(c, f"s.{c}") for c in all_cols)
 
-        if non_pk_cols:
+        if update and non_pk_cols:
             update_set = ", ".join(f"{c} = EXCLUDED.{c}" for c in non_pk_cols)
             conflict = f"ON CONFLICT ({pk_clause}) DO UPDATE SET {update_set}"
         else:
             conflict = f"ON CONFLICT ({pk_clause}) DO NOTHING"
 
-        # Pre-join staging against referenced tables to avoid FK violations.
+        # Semi-join staging against referenced tables to avoid FK violations.
         # This is done in SQL (not Python) so it scales with database size.
-        fk_joins = _build_fk_joins(table_name, staging)
+        fk_filter = _build_fk_filter(table_name)
 
         sql = f"""
             INSERT INTO {table_name} ({insert_cols})
             SELECT {select_cols} FROM {staging} s
-            {fk_joins}
+            {fk_filter}
             {conflict}
         """
         result = conn.execute(text(sql))
 
         # Report any rows dropped by FK filtering
-        staged = conn.execute(text(f"SELECT COUNT(*) FROM {staging}")).scalar()
+        staged = len(df)
         loaded = result.rowcount
-        if loaded < staged:
+        if fk_filter and loaded < staged:
             logger.warning(
                 "%s: %d/%d rows loaded (%d skipped — missing FK refs)",
                 table_name, loaded, staged, staged - loaded,
             )
 
-        conn.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+        # Leave staging empty for a later upsert in the same transaction
+        conn.execute(text(f"DELETE FROM {staging}"))
 
     return loaded
 
 
-def _build_fk_joins(table_name: str, staging: str) -> str:
+# Per-table SELECT overrides applied on the way out of staging
+# (NBA feeds use 0 for "no team/player" on non-player events)
+_SELECT_EXPRS = {
+    "fact_play_by_play": {
+        "team_id": "NULLIF(s.team_id, 0)",
+        "player_id": "NULLIF(s.player_id, 0)",
+    },
+}
+
+
+def _build_fk_filter(table_name: str) -> str:
     """
-    Build SQL JOINs against dimension tables to pre-filter FK violations.
-    This is the scalable replacement for loading entire dimension tables
-    into Python sets — the filtering happens in the database via JOINs.
+    Build a WHERE EXISTS semi-join per referenced dimension to pre-filter
+    FK violations. This is the scalable replacement for loading entire
+    dimension tables into Python sets — the filtering happens in the
+    database, and EXISTS stops at the first PK match without widening rows.
     """
     fk_map = {
         "fact_player_stats": [
@@ -145,9 +345,12 @@ def _build_fk_joins(table_name: str, staging: str) -> str:
         ],
     }
 
-    joins = fk_map.get(table_name, [])
-    return " ".join(
-        f"JOIN {dim} {alias} ON {cond}" for dim, cond, alias in joins
+    checks = fk_map.get(table_name, [])
+    if not checks:
+        return ""
+    return "WHERE " + " AND ".join(
+        f"EXISTS (SELECT 1 FROM {dim} {alias} WHERE {cond})"
+        for dim, cond, alias in checks
     )
 
 
@@ -155,35 +358,54 @@ def _build_fk_joins(table_name: str, staging: str) -> str:
 
 def load_dim_players():
     logger.info("Loading dimension: players")
-    df = pd.read_parquet(f"{SILVER}/players/players.parquet")
+    # Read only the columns the dimension keeps
+    df = pd.read_parquet(
+        f"{SILVER}/players/players.parquet",
+        columns=["id", "first_name", "last_name", "is_active"],
+    )
     df = df.rename(columns={"id": "player_id"})
-    df = df[["player_id", "first_name", "last_name", "is_active"]]
-    df = df.drop_duplicates(subset=["player_id"])
-    count = upsert(df, "players", ["player_id"])
+    with connection(async_commit=True) as conn:
+        count = upsert(df, "players", ["player_id"], conn=conn)
     logger.info("players: %d rows upserted", count)
 
 
+# teams.parquet columns used by the teams and games dimensions
+_TEAMS_DIM_COLS = ["TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME",
+                   "GAME_ID", "SEASON_ID", "GAME_DATE"]
+
+
+@lru_cache(maxsize=1)
+def _read_teams_parquet(path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key so a rewritten file is read again
+    return pd.read_parquet(path, columns=_TEAMS_DIM_COLS)
+
+
+def _teams_frame() -> pd.DataFrame:
+    """teams.parquet, decoded once per file version and shared (read-only)."""
+    path = f"{SILVER}/teams/teams.parquet"
+    return _read_teams_parquet(path, os.path.getmtime(path))
+
+
 def load_dim_teams():
     logger.info("Loading dimension: teams")
-    df = pd.read_parquet(f"{SILVER}/teams/teams.parquet")
+    df = _teams_frame()[["TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME"]]
     teams_df = (
-        df[["TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME"]]
-        .drop_duplicates(subset=["TEAM_ID"])
+        df.drop_duplicates(subset=["TEAM_ID"])
         .rename(columns={
             "TEAM_ID": "id",
             "TEAM_ABBREVIATION": "abbreviation",
             "TEAM_NAME": "team_name",
         })
     )
-    count = upsert(teams_df, "teams", ["id"])
+    with connection(async_commit=True) as conn:
+        count = upsert(teams_df, "teams", ["id"], conn=conn)
     logger.info("teams: %d rows upserted", count)
 
 
 def load_dim_games():
     logger.info("Loading dimension: games")
-    df = pd.read_parquet(f"{SILVER}/teams/teams.parquet")
     games_df = (
-        df[["GAME_ID", "SEASON_ID", "GAME_DATE"]]
+        _teams_frame()[["GAME_ID", "SEASON_ID", "GAME_DATE"]]
         .drop_duplicates(subset=["GAME_ID"])
         .rename(columns={
             "GAME_ID": "game_id",
@@ -191,65 +413,59 @@ def load_dim_games():
             "GAME_DATE": "game_date",
         })
     )
-    games_df["season_id"] = (
-        games_df["season_id"].astype(str).str[-4:].astype(int)
-    )
-    count = upsert(games_df, "games", ["game_id"])
+    # SEASON_ID is a type digit + start year ("22024"): keep the year
+    games_df["season_id"] = pd.to_numeric(games_df["season_id"]) % 10000
+    # Full game history in one merge: rebuild idx_games_date once at the end
+    with connection(async_commit=True) as conn, \
+            _secondary_indexes_dropped(conn, "games"):
+        count = upsert(games_df, "games", ["game_id"], conn=conn)
     logger.info("games: %d rows upserted", count)
 
 
 # ── Fact loaders (date-partitioned) ──────────────────────────────────
 
-def _parse_minutes_str(m):
-    """Convert '12:34' or 'PT12M34.00S' to decimal minutes."""
-    if pd.isna(m) or m == "" or m is None:
-        return None
-    s = str(m)
-    try:
-        if ":" in s and "PT" not in s:
-            parts = s.split(":")
-            return round(float(parts[0]) + float(parts[1]) / 60, 2)
-        if s.startswith("PT"):
-            s = s[2:]
-            mins, rest = s.split("M")
-            return round(float(mins) + float(rest.rstrip("S")) / 60, 2)
-        return round(float(s), 2)
-    except (ValueError, AttributeError):
-        return None
-
-
-def load_fact_player_stats(game_date: str):
-    logger.info("Loading fact: player_stats (%s)", game_date)
-    df = read_silver_partition("boxscores", game_date)
-    if df.empty:
-        return
+_MINUTES_COLON_RE = re.compile(r"^(\d+(?:\.\d+)?):(\d+(?:\.\d+)?)")
+_MINUTES_ISO_RE = re.compile(r"^PT(\d+(?:\.\d+)?)M(\d+(?:\.\d+)?)S$")
+
 
-    gold = df.rename(columns={
+def _parse_minutes(minutes: pd.Series) -> pd.Series:
+    """Convert '12:34' or 'PT12M34.00S' (or plain numbers) to decimal minutes."""
+    s = minutes.astype("string").str.strip()
+    colon = s.str.extract(_MINUTES_COLON_RE).astype(float)
+    iso = s.str.extract(_MINUTES_ISO_RE).astype(float)
+    parsed = (colon[0] + colon[1] / 60).combine_first(iso[0] + iso[1] / 60)
+    parsed = parsed.combine_first(pd.to_numeric(s, errors="coerce"))
+    return parsed.round(2)
+
+
+def load_fact_player_stats(game_date: str, conn=None):
+    logger.info("Loading fact: player_stats (%s)", game_date)
+    renames = {
         "GAME_ID": "game_id", "PERSON_ID": "player_id", "TEAM_ID": "team_id",
         "POSITION": "start_position", "COMMENT": "comment", "minutes": "minutes",
         "offensiveRating": "off_rating", "defensiveRating": "def_rating",
         "netRating": "net_rating", "usagePercentage": "usg_pct",
         "trueShootingPercentage": "ts_pct",
         "effectiveFieldGoalPercentage": "efg_pct", "PIE": "pie",
-    })
+    }
+    df = read_silver_partition("boxscores", game_date, columns=list(renames))
+    if df.empty:
+        return
+
+    gold = df.rename(columns=renames)
 
     cols = ["game_id", "player_id", "team_id", "start_position", "comment",
             "minutes", "off_rating", "def_rating", "net_rating",
             "usg_pct", "ts_pct", "efg_pct", "pie"]
     gold = gold[cols]
-    gold["minutes"] = gold["minutes"].apply(_parse_minutes_str)
-    gold = gold.drop_duplicates(subset=["game_id", "player_id"])
-    count = upsert(gold, "fact_player_stats", ["game_id", "player_id"])
+    gold["minutes"] = _parse_minutes(gold["minutes"])
+    count = upsert(gold, "fact_player_stats", ["game_id", "player_id"], conn=conn)
     logger.info("fact_player_stats: %d rows upserted", count)
 
 
-def load_fact_pbp(game_date: str):
+def load_fact_pbp(game_date: str, conn=None):
     logger.info("Loading fact: play_by_play (%s)", game_date)
-    df = read_silver_partition("pbp", game_date)
-    if df.empty:
-        return
-
-    gold = df.rename(columns={
+    renames = {
         "GAME_ID": "game_id", "actionNumber": "action_number",
         "period": "period", "clock_seconds": "clock_seconds",
         "teamId": "team_id", "personId": "player_id",
@@ -257,27 +473,25 @@ def load_fact_pbp(game_date: str):
         "description": "description", "shotDistance": "shot_distance",
         "scoreHome": "score_home", "scoreAway": "score_away",
         "isFieldGoal": "is_field_goal",
-    })
+    }
+    df = read_silver_partition("pbp", game_date, columns=list(renames))
+    if df.empty:
+        return
+
+    gold = df.rename(columns=renames)
 
     cols = ["game_id", "action_number", "period", "clock_seconds",
             "team_id", "player_id", "action_type", "sub_type",
             "description", "shot_distance", "score_home", "score_away",
             "is_field_goal"]
     gold = gold[cols]
-    gold["team_id"] = gold["team_id"].replace(0, None)
-    gold["player_id"] = gold["player_id"].replace(0, None)
-    gold = gold.drop_duplicates(subset=["game_id", "action_number"])
-    count = upsert(gold, "fact_play_by_play", ["game_id", "action_number"])
+    count = upsert(gold, "fact_play_by_play", ["game_id", "action_number"], conn=conn)
     logger.info("fact_play_by_play: %d rows upserted", count)
 
 
-def load_fact_shots(game_date: str):
+def load_fact_shots(game_date: str, conn=None):
     logger.info("Loading fact: shots (%s)", game_date)
-    df = read_silver_partition("shot_chart", game_date)
-    if df.empty:
-        return
-
-    gold = df.rename(columns={
+    renames = {
         "GAME_ID": "game_id", "GAME_EVENT_ID": "game_event_id",
         "PLAYER_ID": "player_id", "TEAM_ID": "team_id", "PERIOD": "period",
         "LOC_X": "loc_x", "LOC_Y": "loc_y",
@@ -287,115 +501,129 @@ def load_fact_shots(game_date: str):
         "SHOT_ZONE_BASIC": "shot_zone_basic",
         "SHOT_ZONE_AREA": "shot_zone_area",
         "SHOT_ZONE_RANGE": "shot_zone_range",
-    })
+    }
+    df = read_silver_partition("shot_chart", game_date, columns=list(renames))
+    if df.empty:
+        return
+
+    gold = df.rename(columns=renames)
 
     cols = ["game_id", "game_event_id", "player_id", "team_id", "period",
             "loc_x", "loc_y", "shot_distance",
             "shot_attempted_flag", "shot_made_flag",
             "shot_zone_basic", "shot_zone_area", "shot_zone_range"]
     gold = gold[cols]
-    gold = gold.drop_duplicates(subset=["game_id", "game_event_id"])
-    count = upsert(gold, "fact_shots", ["game_id", "game_event_id"])
+    count = upsert(gold, "fact_shots", ["game_id", "game_event_id"], conn=conn)
     logger.info("fact_shots: %d rows upserted", count)
 
 
 # ── Bulk fact loaders (from unpartitioned files) ─────────────────────
 
+# teams.parquet holds every team's full history — stream it in row batches
+# so peak memory is one batch, not the whole table
+_TEAM_STATS_BATCH_ROWS = 50_000
+
+
 def load_fact_team_stats():
     logger.info("Loading fact: team_stats (all history)")
-    df = pd.read_parquet(f"{SILVER}/teams/teams.parquet")
-
-    gold = df.rename(columns={
-        "GAME_ID": "game_id", "TEAM_ID": "team_id",
-        "MATCHUP": "matchup", "WL": "wl", "MIN": "minutes",
-        "PTS": "pts", "PLUS_MINUS": "plus_minus",
-    })
-    gold = gold[["game_id", "team_id", "matchup", "wl",
-                  "minutes", "pts", "plus_minus"]]
-    gold["pts"] = pd.to_numeric(gold["pts"], errors="coerce")
-    gold["plus_minus"] = pd.to_numeric(gold["plus_minus"], errors="coerce")
-    gold["minutes"] = pd.to_numeric(gold["minutes"], errors="coerce")
-    gold = gold.drop_duplicates(subset=["game_id", "team_id"])
-
-    count = upsert(gold, "fact_team_stats", ["game_id", "team_id"])
+    parquet = pq.ParquetFile(f"{SILVER}/teams/teams.parquet")
+    columns = ["GAME_ID", "TEAM_ID", "MATCHUP", "WL", "MIN", "PTS", "PLUS_MINUS"]
+
+    # One transaction for the whole history (all batches or none), with the
+    # secondary index dropped before the first batch and rebuilt after the last
+    count = 0
+    with connection(async_commit=True) as conn, \
+            _secondary_indexes_dropped(conn, "fact_team_stats"):
+        for batch in parquet.iter_batches(batch_size=_TEAM_STATS_BATCH_ROWS,
+                                          columns=columns):
+            gold = batch.to_pandas().rename(columns={
+                "GAME_ID": "game_id", "TEAM_ID": "team_id",
+                "MATCHUP": "matchup", "WL": "wl", "MIN": "minutes",
+                "PTS": "pts", "PLUS_MINUS": "plus_minus",
+            })
+            gold["pts"] = pd.to_numeric(gold["pts"], errors="coerce")
+            gold["plus_minus"] = pd.to_numeric(gold["plus_minus"], errors="coerce")
+            gold["minutes"] = pd.to_numeric(gold["minutes"], errors="coerce")
+
+            count += upsert(gold, "fact_team_stats", ["game_id", "team_id"],
+                            conn=conn)
     logger.info("fact_team_stats: %d rows upserted", count)
 
 
 # ── Auto-dimension helpers ───────────────────────────────────────────
 
-def _ensure_dims_for_date(game_date: str):
+def _ensure_dims_for_date(game_date: str, conn=None):
     """
     Upsert stub dimension records (games, players, teams) from the Silver
     boxscore data for this date.  This ensures FK refs exist before fact
     inserts, making each date fully self-contained during backfill.
     """
-    df = read_silver_partition("boxscores", game_date)
+    df = read_silver_partition("boxscores", game_date, columns=[
+        "GAME_ID", "PERSON_ID", "FIRST_NAME", "FAMILY_NAME", "TEAM_ID", "TEAM_TRICODE",
+    ])
     if df.empty:
         return
 
-    season = get_nba_season(game_date)
+    games = pd.DataFrame({"game_id": df["GAME_ID"].dropna().unique()})
+    games["season_id"] = get_nba_season(game_date)
+    games["game_date"] = pd.Timestamp(game_date)
 
-    with engine.begin() as conn:
-        # ── games ──
-        game_ids = df["GAME_ID"].dropna().unique()
-        for gid in game_ids:
-            conn.execute(text(
-                "INSERT INTO games (game_id, season_id, game_date) "
-                "VALUES (:gid, :season, :gdate) "
-                "ON CONFLICT (game_id) DO NOTHING"
-            ), {"gid": gid, "season": season, "gdate": game_date})
-
-        # ── players ──
-        players = (
-            df[["PERSON_ID", "FIRST_NAME", "FAMILY_NAME"]]
-            .dropna(subset=["PERSON_ID"])
-            .drop_duplicates(subset=["PERSON_ID"])
-        )
-        for _, row in players.iterrows():
-            conn.execute(text(
-                "INSERT INTO players (player_id, first_name, last_name, is_active) "
-                "VALUES (:pid, :first, :last, TRUE) "
-                "ON CONFLICT (player_id) DO NOTHING"
-            ), {
-                "pid": int(row["PERSON_ID"]),
-                "first": row.get("FIRST_NAME", ""),
-                "last": row.get("FAMILY_NAME", ""),
-            })
+    players = (
+        df[["PERSON_ID", "FIRST_NAME", "FAMILY_NAME"]]
+        .dropna(subset=["PERSON_ID"])
+        .drop_duplicates(subset=["PERSON_ID"])
+        .rename(columns={
+            "PERSON_ID": "player_id",
+            "FIRST_NAME": "first_name",
+            "FAMILY_NAME": "last_name",
+        })
+    )
+    players["is_active"] = True
 
-        # ── teams ──
-        teams = (
-            df[["TEAM_ID", "TEAM_TRICODE"]]
-            .dropna(subset=["TEAM_ID"])
-            .drop_duplicates(subset=["TEAM_ID"])
-        )
-        for _, row in teams.iterrows():
-            conn.execute(text(
-                "INSERT INTO teams (id, abbreviation, team_name) "
-                "VALUES (:tid, :abbr, :abbr) "
-                "ON CONFLICT (id) DO NOTHING"
-            ), {"tid": int(row["TEAM_ID"]), "abbr": row.get("TEAM_TRICODE", "")})
+    teams = (
+        df[["TEAM_ID", "TEAM_TRICODE"]]
+        .dropna(subset=["TEAM_ID"])
+        .drop_duplicates(subset=["TEAM_ID"])
+        .rename(columns={"TEAM_ID": "id", "TEAM_TRICODE": "abbreviation"})
+    )
+    teams["team_name"] = teams["abbreviation"]
+
+    # Set-based COPY + ON CONFLICT DO NOTHING — never overwrites real dims.
+    # One transaction for all three (or the caller's): one checkout, one commit.
+    # Key order keeps row-lock order consistent when dates load concurrently.
+    games = games.sort_values("game_id")
+    players = players.sort_values("player_id")
+    teams = teams.sort_values("id")
+    with nullcontext(conn) if conn is not None else engine.begin() as conn:
+        upsert(games, "games", ["game_id"], update=False, conn=conn)
+        upsert(players, "players", ["player_id"], update=False, conn=conn)
+        upsert(teams, "teams", ["id"], update=False, conn=conn)
 
     logger.debug("Dimension stubs ensured for %s", game_date)
 
 
 # ── Orchestration ────────────────────────────────────────────────────
 
-def load_date(game_date: str):
+def load_date(game_date: str, conn=None):
+    """
+    Load one date's Silver partitions into Gold as a single transaction.
+    Pass conn to run inside the caller's transaction instead.
+    """
     # Check manifest — skip no-game days
     manifest_path = f"{settings.bronze_path}/manifests/{game_date}.json"
     if os.path.exists(manifest_path):
-        with open(manifest_path) as f:
-            game_ids = json.load(f).get("game_ids", [])
+        game_ids = _read_json(manifest_path).get("game_ids", [])
         if not game_ids:
             logger.info("No games on %s — nothing to load.", game_date)
             return
 
-    # Create stub dimension records so FK joins resolve
-    _ensure_dims_for_date(game_date)
+    with nullcontext(conn) if conn is not None else connection() as conn:
+        # Create stub dimension records so FK joins resolve
+        _ensure_dims_for_date(game_date, conn=conn)
 
-    load_fact_player_stats(game_date)
-    load_fact_pbp(game_date)
-    load_fact_shots(game_date)
+        load_fact_player_stats(game_date, conn=conn)
+        load_fact_pbp(game_date, conn=conn)
+        load_fact_shots(game_date, conn=conn)
 
 
 # ── CLI ──────────────────────────────────────────────────────────────
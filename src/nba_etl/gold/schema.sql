@@ -13,6 +13,7 @@ CREATE TABLE IF NOT EXISTS games (
     season_id INT,
     game_date DATE
 );
+CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
 
 CREATE TABLE IF NOT EXISTS players (
     player_id INT PRIMARY KEY,
@@ -44,6 +45,7 @@ CREATE TABLE IF NOT EXISTS fact_player_stats (
     FOREIGN KEY (player_id) REFERENCES players(player_id),
     FOREIGN KEY (team_id) REFERENCES teams(id)
 );
+CREATE INDEX IF NOT EXISTS idx_player_stats_player_game ON fact_player_stats(player_id, game_id);
 
 -- 3. Fact: Team Game Logs
 CREATE TABLE IF NOT EXISTS fact_team_stats (
@@ -65,6 +67,7 @@ CREATE TABLE IF NOT EXISTS fact_team_stats (
     FOREIGN KEY (game_id) REFERENCES games(game_id),
     FOREIGN KEY (team_id) REFERENCES teams(id)
 );
+CREATE INDEX IF NOT EXISTS idx_team_stats_team_game ON fact_team_stats(team_id, game_id);
 
 -- 4. Fact: Play by Play (V3)
 CREATE TABLE IF NOT EXISTS fact_play_by_play (
@@ -111,3 +114,5 @@ CREATE TABLE IF NOT EXISTS fact_shots (
     FOREIGN KEY (game_id) REFERENCES games(game_id),
     FOREIGN KEY (player_id) REFERENCES players(player_id)
 );
+CREATE INDEX IF NOT EXISTS idx_shots_player_game ON fact_shots(player_id, game_id);
+CREATE INDEX IF NOT EXISTS idx_shots_player_made ON fact_shots(player_id) WHERE shot_made_flag;
@@ -22,14 +22,19 @@ Data Contracts:
 """
 
 import os
-import json
+import re
 import glob
+import time
 import logging
 import argparse
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from dataclasses import dataclass, field
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from nba_etl.config import settings
 
@@ -38,6 +43,15 @@ logger = logging.getLogger(__name__)
 BRONZE = settings.bronze_path
 SILVER = settings.silver_path
 
+# Shared parquet writer options: zstd-1 is about as fast as snappy but
+# smaller, and the string-heavy columns dictionary-encode well.
+_PARQUET_OPTS = dict(
+    compression="zstd",
+    compression_level=1,
+    use_dictionary=True,
+    data_page_size=1_048_576,
+)
+
 
 # ── Validation framework ─────────────────────────────────────────────
 
@@ -109,21 +123,28 @@ def _validate(source: str) -> ValidationResult:
 
 # ── Season helper ────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def get_nba_season(game_date: str) -> int:
-    dt = datetime.strptime(game_date, "%Y-%m-%d")
-    return dt.year if dt.month >= 10 else dt.year - 1
+    # "YYYY-MM-DD" — slice year/month directly; seasons start in October
+    year, month = int(game_date[:4]), int(game_date[5:7])
+    return year if month >= 10 else year - 1
 
 
 # ── Manifest reader ──────────────────────────────────────────────────
 
+def _read_json(path: str):
+    """Read a Bronze JSON file: one bytes read, parsed by orjson (no str decode)."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def load_manifest(game_date: str) -> list[str]:
     manifest_path = f"{BRONZE}/manifests/{game_date}.json"
     if not os.path.exists(manifest_path):
         raise FileNotFoundError(
             f"No manifest at {manifest_path}. Run ingestion.py {game_date} first."
         )
-    with open(manifest_path, "r") as f:
-        return json.load(f)["game_ids"]
+    return _read_json(manifest_path)["game_ids"]
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
@@ -132,20 +153,73 @@ def _game_id_from_file(file_path: str) -> str:
     return os.path.basename(file_path).replace(".json", "")
 
 
-def _save_partitioned(df: pd.DataFrame, dataset: str, season: int, game_date: str):
-    out_dir = f"{SILVER}/{dataset}/season={season}/game_date={game_date}"
-    os.makedirs(out_dir, exist_ok=True)
-    out_path = f"{out_dir}/data.parquet"
-    df.to_parquet(out_path, index=False)
-    logger.info("%s → %d rows", out_path, len(df))
+def _coerce_numeric(df: pd.DataFrame, int_cols: list[str],
+                    float_cols: list[str] = ()) -> None:
+    """Coerce columns to numbers in place; int_cols become nullable Int64.
+
+    One pd.to_numeric per column — a frame-wide apply + astype is slower.
+    Columns missing from df (older feeds omit some) are skipped.
+    """
+    for col in int_cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+    for col in float_cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+
+def _drop_dup_keys(df: pd.DataFrame, subset: list[str]) -> pd.DataFrame:
+    """drop_duplicates that returns df itself (no copy) when keys are unique."""
+    dup = df.duplicated(subset=subset)
+    return df[~dup] if dup.any() else df
+
+
+def _narrow(df: pd.DataFrame, dtypes: dict[str, str]):
+    """Downcast bounded numeric columns in place (if present)."""
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+
+
+def _categorize(df: pd.DataFrame, cols: list[str]):
+    """Dictionary-encode low-cardinality string columns in place (if present)."""
+    for col in cols:
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col])
+
+
+def _partition_path(dataset: str, season: int, game_date: str) -> str:
+    return f"{SILVER}/{dataset}/season={season}/game_date={game_date}/data.parquet"
+
+
+def _save_partitioned(frames: list[pd.DataFrame], dataset: str, season: int,
+                      game_date: str):
+    """
+    Write one date's per-game frames as a single partition file.
+    One pandas concat then one Arrow conversion — cheaper than converting
+    each game and unifying per-game schemas with pa.concat_tables.
+    """
+    table = pa.Table.from_pandas(pd.concat(frames, ignore_index=True),
+                                 preserve_index=False)
+    out_path = _partition_path(dataset, season, game_date)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    pq.write_table(table, out_path, **_PARQUET_OPTS)
+    logger.info("%s → %d rows", out_path, table.num_rows)
 
 
 # ── Converters ───────────────────────────────────────────────────────
 
+# Boxscore columns that are not numeric statistics
+_BOX_NON_STAT_COLS = {
+    "GAME_ID", "PERSON_ID", "FIRST_NAME", "FAMILY_NAME", "NAME_I",
+    "POSITION", "COMMENT", "JERSEY_NUM", "TEAM_ID", "TEAM_TRICODE",
+    "TEAM_TYPE", "minutes",
+}
+
+
 def convert_boxscore(file_path: str) -> pd.DataFrame:
     game_id = _game_id_from_file(file_path)
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    data = _read_json(file_path)
 
     try:
         bs = data["boxScoreAdvanced"]
@@ -153,42 +227,43 @@ def convert_boxscore(file_path: str) -> pd.DataFrame:
         logger.warning("No boxScoreAdvanced in %s, skipping", file_path)
         return pd.DataFrame()
 
-    all_players = []
+    # Column-wise (dict of lists) rather than one dict per player
+    cols = {c: [] for c in (
+        "PERSON_ID", "FIRST_NAME", "FAMILY_NAME", "NAME_I", "POSITION",
+        "COMMENT", "JERSEY_NUM", "TEAM_ID", "TEAM_TRICODE", "TEAM_TYPE",
+    )}
+    stats = []
     for team_type in ["homeTeam", "awayTeam"]:
         team_data = bs.get(team_type, {})
         team_id = team_data.get("teamId")
         team_tricode = team_data.get("teamTricode", "")
+        side = "HOME" if team_type == "homeTeam" else "AWAY"
 
         for player in team_data.get("players", []):
-            row = {
-                "PERSON_ID": player.get("personId"),
-                "FIRST_NAME": player.get("firstName", ""),
-                "FAMILY_NAME": player.get("familyName", ""),
-                "NAME_I": player.get("nameI", ""),
-                "POSITION": player.get("position", ""),
-                "COMMENT": player.get("comment", ""),
-                "JERSEY_NUM": player.get("jerseyNum", ""),
-                "TEAM_ID": team_id,
-                "TEAM_TRICODE": team_tricode,
-                "TEAM_TYPE": "HOME" if team_type == "homeTeam" else "AWAY",
-            }
-            for k, v in player.get("statistics", {}).items():
-                row[k] = v
-            all_players.append(row)
-
-    if not all_players:
+            cols["PERSON_ID"].append(player.get("personId"))
+            cols["FIRST_NAME"].append(player.get("firstName", ""))
+            cols["FAMILY_NAME"].append(player.get("familyName", ""))
+            cols["NAME_I"].append(player.get("nameI", ""))
+            cols["POSITION"].append(player.get("position", ""))
+            cols["COMMENT"].append(player.get("comment", ""))
+            cols["JERSEY_NUM"].append(player.get("jerseyNum", ""))
+            cols["TEAM_ID"].append(team_id)
+            cols["TEAM_TRICODE"].append(team_tricode)
+            cols["TEAM_TYPE"].append(side)
+            stats.append(player.get("statistics", {}))
+
+    if not stats:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_players)
+    # Union of stat keys in first-seen order (what the list-of-dicts build did)
+    for key in dict.fromkeys(k for st in stats for k in st):
+        cols[key] = [st.get(key) for st in stats]
+
+    df = pd.DataFrame(cols)
     df["GAME_ID"] = game_id
-    df["PERSON_ID"] = pd.to_numeric(df["PERSON_ID"], errors="coerce").astype("Int64")
-    df["TEAM_ID"] = pd.to_numeric(df["TEAM_ID"], errors="coerce").astype("Int64")
-    for col in [c for c in df.columns if c not in (
-            "GAME_ID", "PERSON_ID", "FIRST_NAME", "FAMILY_NAME", "NAME_I",
-            "POSITION", "COMMENT", "JERSEY_NUM", "TEAM_ID", "TEAM_TRICODE",
-            "TEAM_TYPE", "minutes")]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df = df.drop_duplicates(subset=["GAME_ID", "PERSON_ID"])
+    _coerce_numeric(df, ["PERSON_ID", "TEAM_ID"],
+                    [c for c in df.columns if c not in _BOX_NON_STAT_COLS])
+    df = _drop_dup_keys(df, ["GAME_ID", "PERSON_ID"])
 
     # ── Validation ──
     v = _validate(f"boxscore/{game_id}")
@@ -205,10 +280,13 @@ def convert_boxscore(file_path: str) -> pd.DataFrame:
     return df
 
 
+# ISO-8601 game clock, e.g. "PT11M32.00S" → (11, 32.00)
+_CLOCK_RE = re.compile(r"^PT(\d+(?:\.\d+)?)M(\d+(?:\.\d+)?)S$")
+
+
 def convert_pbp(file_path: str) -> pd.DataFrame:
     game_id = _game_id_from_file(file_path)
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    data = _read_json(file_path)
 
     try:
         actions = data["game"]["actions"]
@@ -220,26 +298,18 @@ def convert_pbp(file_path: str) -> pd.DataFrame:
 
     df = pd.DataFrame(actions)
     df["GAME_ID"] = game_id
-    df["period"] = pd.to_numeric(df["period"], errors="coerce").astype("Int64")
-    df["teamId"] = pd.to_numeric(df["teamId"], errors="coerce").astype("Int64")
-    df["personId"] = pd.to_numeric(df["personId"], errors="coerce").astype("Int64")
-    df["shotDistance"] = pd.to_numeric(df["shotDistance"], errors="coerce")
+    _coerce_numeric(df, ["period", "teamId", "personId", "scoreHome", "scoreAway"],
+                    ["shotDistance"])
     df["isFieldGoal"] = df["isFieldGoal"].astype(bool)
-    df["scoreHome"] = pd.to_numeric(df["scoreHome"], errors="coerce").astype("Int64")
-    df["scoreAway"] = pd.to_numeric(df["scoreAway"], errors="coerce").astype("Int64")
-
-    def _parse_clock(clock_str):
-        if not isinstance(clock_str, str) or not clock_str.startswith("PT"):
-            return None
-        try:
-            t = clock_str[2:]
-            mins, rest = t.split("M")
-            return float(mins) * 60 + float(rest.rstrip("S"))
-        except (ValueError, AttributeError):
-            return None
-
-    df["clock_seconds"] = df["clock"].apply(_parse_clock)
-    df = df.drop_duplicates(subset=["GAME_ID", "actionNumber"])
+    _narrow(df, {"period": "Int8", "scoreHome": "Int16", "scoreAway": "Int16"})
+
+    # "PT11M32.00S" → 692.0; anything else → NaN
+    if "clock" in df.columns and df["clock"].notna().any():
+        clock = df["clock"].astype("string").str.extract(_CLOCK_RE).astype(float)
+        df["clock_seconds"] = clock[0] * 60 + clock[1]
+    else:
+        df["clock_seconds"] = float("nan")
+    df = _drop_dup_keys(df, ["GAME_ID", "actionNumber"])
 
     # ── Validation ──
     v = _validate(f"pbp/{game_id}")
@@ -258,8 +328,7 @@ def convert_pbp(file_path: str) -> pd.DataFrame:
 
 def convert_shotchart(file_path: str) -> pd.DataFrame:
     game_id = _game_id_from_file(file_path)
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    data = _read_json(file_path)
 
     try:
         results = data["resultSets"][0]
@@ -272,16 +341,16 @@ def convert_shotchart(file_path: str) -> pd.DataFrame:
         return df
 
     df["GAME_ID"] = game_id
-    df["PLAYER_ID"] = pd.to_numeric(df["PLAYER_ID"], errors="coerce").astype("Int64")
-    df["TEAM_ID"] = pd.to_numeric(df["TEAM_ID"], errors="coerce").astype("Int64")
-    df["PERIOD"] = pd.to_numeric(df["PERIOD"], errors="coerce").astype("Int64")
-    df["SHOT_DISTANCE"] = pd.to_numeric(df["SHOT_DISTANCE"], errors="coerce")
-    df["LOC_X"] = pd.to_numeric(df["LOC_X"], errors="coerce")
-    df["LOC_Y"] = pd.to_numeric(df["LOC_Y"], errors="coerce")
+    _coerce_numeric(df, ["PLAYER_ID", "TEAM_ID", "PERIOD"],
+                    ["SHOT_DISTANCE", "LOC_X", "LOC_Y"])
     df["SHOT_ATTEMPTED_FLAG"] = df["SHOT_ATTEMPTED_FLAG"].astype(bool)
     df["SHOT_MADE_FLAG"] = df["SHOT_MADE_FLAG"].astype(bool)
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="%Y%m%d", errors="coerce")
-    df = df.drop_duplicates(subset=["GAME_ID", "GAME_EVENT_ID"])
+    _narrow(df, {"PERIOD": "Int8", "LOC_X": "Int16", "LOC_Y": "Int16"})
+    # One date per game file: string dtype keeps the fixed-format fast path
+    df["GAME_DATE"] = pd.to_datetime(
+        df["GAME_DATE"].astype("string"), format="%Y%m%d", errors="coerce", cache=True
+    )
+    df = _drop_dup_keys(df, ["GAME_ID", "GAME_EVENT_ID"])
 
     # ── Validation ──
     v = _validate(f"shots/{game_id}")
@@ -300,14 +369,13 @@ def convert_shotchart(file_path: str) -> pd.DataFrame:
 
 def process_players():
     logger.info("Processing players...")
-    with open(f"{BRONZE}/players/players.json", "r") as f:
-        data = json.load(f)
+    data = _read_json(f"{BRONZE}/players/players.json")
     df = pd.DataFrame(data)
     df["id"] = df["id"].astype(int)
     df["is_active"] = df["is_active"].astype(bool)
     for col in ["full_name", "first_name", "last_name"]:
         df[col] = df[col].astype(str).str.strip()
-    df = df.drop_duplicates(subset=["id"])
+    df = _drop_dup_keys(df, ["id"])
 
     # ── Validation ──
     v = _validate("players")
@@ -318,35 +386,70 @@ def process_players():
 
     out = f"{SILVER}/players"
     os.makedirs(out, exist_ok=True)
-    df.to_parquet(f"{out}/players.parquet", index=False)
+    df.to_parquet(f"{out}/players.parquet", index=False, **_PARQUET_OPTS)
     logger.info("players → %d rows", len(df))
 
 
+_TEAM_STR_COLS = ["SEASON_ID", "TEAM_ABBREVIATION", "TEAM_NAME",
+                  "GAME_ID", "MATCHUP", "WL"]
+_TEAM_PARSE_WORKERS = min(8, os.cpu_count() or 1)  # processes for process_teams
+
+
+def _parse_team_file(tf: str) -> pd.DataFrame | None:
+    """Parse one team's LeagueGameFinder history; None if the file is bad."""
+    try:
+        data = _read_json(tf)
+        headers = data["resultSets"][0]["headers"]
+        rows = data["resultSets"][0]["rowSet"]
+        df = pd.DataFrame(rows, columns=headers)
+        df["TEAM_ID"] = df["TEAM_ID"].astype(int)
+        # Arrow-backed strings: compact, and concat copies buffers not objects
+        df[_TEAM_STR_COLS] = df[_TEAM_STR_COLS].astype("string[pyarrow]")
+        _coerce_numeric(
+            df,
+            ["PTS", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA",
+             "OREB", "DREB", "REB", "AST", "STL", "BLK", "TOV", "PF"],
+            ["PLUS_MINUS", "FG_PCT", "FG3_PCT", "FT_PCT"],
+        )
+        df["GAME_DATE"] = pd.to_datetime(
+            df["GAME_DATE"], format="%Y-%m-%d", errors="coerce", cache=True
+        )
+        return _drop_dup_keys(df, ["GAME_ID", "TEAM_ID"])
+    except Exception as e:
+        logger.error("Error in %s: %s", tf, e)
+        return None
+
+
 def process_teams():
     logger.info("Processing teams...")
-    team_files = glob.glob(f"{BRONZE}/teams/*.json")
-    frames = []
-    for tf in sorted(team_files):
-        try:
-            with open(tf, "r") as f:
-                data = json.load(f)
-            headers = data["resultSets"][0]["headers"]
-            rows = data["resultSets"][0]["rowSet"]
-            df = pd.DataFrame(rows, columns=headers)
-            df["TEAM_ID"] = df["TEAM_ID"].astype(int)
-            df["PTS"] = pd.to_numeric(df["PTS"], errors="coerce").astype("Int64")
-            df["PLUS_MINUS"] = pd.to_numeric(df["PLUS_MINUS"], errors="coerce")
-            for col in ["FG_PCT", "FG3_PCT", "FT_PCT"]:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-            for col in ["FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA",
-                        "OREB", "DREB", "REB", "AST", "STL", "BLK", "TOV", "PF"]:
-                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-            df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], errors="coerce")
-            frames.append(df.drop_duplicates(subset=["GAME_ID", "TEAM_ID"]))
-        except Exception as e:
-            logger.error("Error in %s: %s", tf, e)
-
-    df = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["GAME_ID", "TEAM_ID"])
+    started = time.time()
+    team_files = sorted(glob.glob(f"{BRONZE}/teams/*.json"))
+    out_path = f"{SILVER}/teams/teams.parquet"
+
+    # Incremental: only re-parse team files written since the last build
+    previous = None
+    if os.path.exists(out_path):
+        built_at = os.path.getmtime(out_path)
+        team_files = [tf for tf in team_files if os.path.getmtime(tf) > built_at]
+        if not team_files:
+            logger.info("teams up to date — no team files newer than teams.parquet")
+            return
+        previous = pd.read_parquet(out_path)
+
+    # Team histories are large and parsing is CPU-bound (GIL-held pandas
+    # coercion), so spread files over processes rather than threads
+    with ProcessPoolExecutor(max_workers=_TEAM_PARSE_WORKERS) as pool:
+        parsed = pool.map(_parse_team_file, team_files)
+        frames = [df for df in parsed if df is not None]
+    if previous is not None:
+        refreshed = {int(f["TEAM_ID"].iat[0]) for f in frames if not f.empty}
+        frames.insert(0, previous[~previous["TEAM_ID"].isin(refreshed)])
+
+    # Each file holds a single TEAM_ID, so per-file dedup is already global
+    df = pd.concat(frames, ignore_index=True)
+    # After the concat: per-file categoricals with differing vocabularies
+    # would fall back to object there
+    _categorize(df, ["WL"])
 
     # ── Validation ──
     v = _validate("teams")
@@ -359,16 +462,52 @@ def process_teams():
     v.check_range(df, "FT_PCT", min_val=0, max_val=1)
     v.log_summary()
 
-    out = f"{SILVER}/teams"
-    os.makedirs(out, exist_ok=True)
-    df.to_parquet(f"{out}/teams.parquet", index=False)
-    logger.info("teams → %d rows", len(df))
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    df.to_parquet(out_path, index=False, **_PARQUET_OPTS)
+    # Stamp with the start time so files landing mid-run count as newer next time
+    os.utime(out_path, (started, started))
+    logger.info("teams → %d rows (%d file(s) parsed)", len(df), len(team_files))
 
 
 # ── Date-based fact processors ───────────────────────────────────────
 
-def process_date(game_date: str):
-    game_ids = load_manifest(game_date)
+_CONVERT_WORKERS = 16  # threads converting one date's games
+
+# (Silver dataset, converter, Bronze directory prefix)
+_GAME_DATASETS = [
+    ("boxscores", convert_boxscore, f"{BRONZE}/boxscores/"),
+    ("pbp", convert_pbp, f"{BRONZE}/pbp/"),
+    ("shot_chart", convert_shotchart, f"{BRONZE}/shot_chart/"),
+]
+
+
+def _convert_game(gid: str, datasets: list[tuple]) -> list[pd.DataFrame | None]:
+    """Convert one game's Bronze files, one frame (or None) per dataset."""
+    frames = []
+    for _, converter, base in datasets:
+        path = base + gid + ".json"
+        frames.append(converter(path) if os.path.exists(path) else None)
+    return frames
+
+
+def _is_up_to_date(out_path: str, sources: list[str]) -> bool:
+    """True if out_path exists and is at least as new as every source file."""
+    if not os.path.exists(out_path):
+        return False
+    built_at = os.path.getmtime(out_path)
+    return all(
+        os.path.getmtime(src) <= built_at for src in sources if os.path.exists(src)
+    )
+
+
+def process_date(game_date: str, force: bool = False):
+    """
+    Bronze → Silver for one date. A dataset whose partition is newer than
+    all of its Bronze files is left as is, unless force=True.
+    """
+    # Unique game ids keep every Silver key unique per partition, which
+    # Gold relies on instead of deduplicating again
+    game_ids = list(dict.fromkeys(load_manifest(game_date)))
 
     if not game_ids:
         logger.info("No games on %s — nothing to extract.", game_date)
@@ -377,20 +516,28 @@ def process_date(game_date: str):
     season = get_nba_season(game_date)
     logger.info("Processing %d games for %s (season %d)", len(game_ids), game_date, season)
 
-    for dataset, converter, subfolder in [
-        ("boxscores", convert_boxscore, "boxscores"),
-        ("pbp", convert_pbp, "pbp"),
-        ("shot_chart", convert_shotchart, "shot_chart"),
-    ]:
-        frames = []
-        for gid in game_ids:
-            path = f"{BRONZE}/{subfolder}/{gid}.json"
-            if os.path.exists(path):
-                df = converter(path)
-                if not df.empty:
-                    frames.append(df)
+    datasets = []
+    for entry in _GAME_DATASETS:
+        dataset, _, base = entry
+        out_path = _partition_path(dataset, season, game_date)
+        sources = [base + gid + ".json" for gid in game_ids]
+        if not force and _is_up_to_date(out_path, sources):
+            logger.info("%s for %s is up to date — skipping", dataset, game_date)
+        else:
+            datasets.append(entry)
+    if not datasets:
+        return
+
+    # One pass over the games, each reading all of its files; small-file
+    # reads + C-level parsing overlap well across threads, and map() keeps
+    # manifest order so the output is deterministic
+    with ThreadPoolExecutor(max_workers=min(_CONVERT_WORKERS, len(game_ids))) as pool:
+        per_game = list(pool.map(partial(_convert_game, datasets=datasets), game_ids))
+
+    for i, (dataset, _, _) in enumerate(datasets):
+        frames = [g[i] for g in per_game if g[i] is not None and not g[i].empty]
         if frames:
-            _save_partitioned(pd.concat(frames, ignore_index=True), dataset, season, game_date)
+            _save_partitioned(frames, dataset, season, game_date)
         else:
             logger.warning("No %s data for %s", dataset, game_date)
 
@@ -434,6 +581,8 @@ if __name__ == "__main__":
     parser.add_argument("game_date", help="YYYY-MM-DD")
     parser.add_argument("--dims", action="store_true",
                         help="Also process dimension tables (players + teams).")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild partitions even if newer than their Bronze files.")
     args = parser.parse_args()
 
     logger.info("=" * 50)
@@ -444,7 +593,7 @@ if __name__ == "__main__":
         process_players()
         process_teams()
 
-    process_date(args.game_date)
+    process_date(args.game_date, force=args.force)
 
     print_validation_report()
     logger.info("Done — Silver parquets written.")
\ No newline at end of file